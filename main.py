@@ -17,7 +17,7 @@ def main():
 
     # Load the raw data
     csv_pandas_handler = api.create_data_handler(
-        pipeline_params["raw_format"], pipeline_params["backend"]
+        pipeline_params["raw_data_format"], pipeline_params["data_backend"]
     )
     # raw_data = csv_pandas_handler()
     # Clean the raw data
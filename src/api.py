@@ -1,11 +1,41 @@
 """src/api.py
+
+The factories below are imported lazily on first access (PEP 562), as their
+modules pull in pandas and scikit-learn. Only `load_parameters` is imported
+eagerly.
 """
 
+import importlib
+
 from src.load_parameters import load_parameters
-from src.data.encoders import create_encoder
-from src.data.validators import create_data_validator
-from src.data.cleaners import create_cleaner
-from src.features.builders import create_feature_builder
-from src.model.split_data import train_test_split
-from src.model.trainers import create_model_trainer
-from src.model.testers import create_model_tester
+
+# Public name -> (module, attribute)
+_LAZY_ATTRIBUTES = {
+    "create_data_handler": ("src.data.handlers", "create_data_handler"),
+    "create_encoder": ("src.data.encoders", "create_encoder"),
+    "create_data_validator": ("src.data.validators", "create_validator"),
+    "create_cleaner": ("src.data.cleaners", "create_cleaner"),
+    "create_feature_builder": ("src.features.builders", "create_feature_builder"),
+    "train_test_split": ("src.model.split_data", "train_test_split"),
+    "create_model_trainer": ("src.model.trainers", "create_model_trainer"),
+    "create_model_tester": ("src.model.testers", "create_model_tester"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(importlib.import_module(module_name), attribute)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -0,0 +1,152 @@
+"""data/_arrow_csv.py
+
+Purpose
+-------
+This module reads CSV files with PyArrow so that the values match what
+`pd.read_csv` gives for the same file. It is shared by the CSV encoder and
+the CSV data handler, and requires the optional `pyarrow` dependency.
+
+Arrow's defaults differ from pandas in the ways corrected here:
+- Arrow reads fewer tokens as missing, so pandas' default NA strings (e.g.
+"", "NA", "None", "<NA>") are passed as its null values.
+- Arrow infers dates, times and timestamps where pandas keeps the text, so
+such columns are read again as strings, unless their type was given.
+- Arrow converts missing booleans, and all-missing columns, to `None`
+where pandas gives NaN.
+
+Functions
+---------
+- `read_csv`: Read a CSV file into a PyArrow Table.
+- `open_csv`: Open a CSV file for reading as a stream of RecordBatches.
+- `to_pandas`: Convert a Table or RecordBatch into a Pandas DataFrame.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas._libs.parsers import STR_NA_VALUES
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+
+
+def read_csv(
+    path: str,
+    usecols: list[str] | None = None,
+    dtype: dict[str, str] | None = None,
+) -> pa.Table:
+    """Reads a CSV file into a PyArrow Table.
+
+    Args:
+        path: The path to the CSV file.
+        usecols: The columns to read. Default is `None` (all columns).
+        dtype: Mapping of column -> Arrow type name (e.g. "int64") applied
+        while parsing. Default is `None` (inferred).
+
+    Returns:
+        The data as a PyArrow Table.
+    """
+    convert_options = _convert_options(usecols, dtype)
+    table = pa_csv.read_csv(path, convert_options=convert_options)
+
+    if _use_pandas_types(table.schema, convert_options):
+        table = pa_csv.read_csv(path, convert_options=convert_options)
+
+    return table
+
+
+def open_csv(
+    path: str,
+    usecols: list[str] | None = None,
+    dtype: dict[str, str] | None = None,
+) -> pa_csv.CSVStreamingReader:
+    """Opens a CSV file for reading as a stream of PyArrow RecordBatches.
+
+    Types are inferred from the first block of the file only.
+
+    Args:
+        path: The path to the CSV file.
+        usecols: The columns to read. Default is `None` (all columns).
+        dtype: Mapping of column -> Arrow type name (e.g. "int64") applied
+        while parsing. Default is `None` (inferred).
+
+    Returns:
+        The streaming reader, to be used as a context manager.
+    """
+    convert_options = _convert_options(usecols, dtype)
+    reader = pa_csv.open_csv(path, convert_options=convert_options)
+
+    if _use_pandas_types(reader.schema, convert_options):
+        reader.close()
+        reader = pa_csv.open_csv(path, convert_options=convert_options)
+
+    return reader
+
+
+def to_pandas(data: pa.Table | pa.RecordBatch) -> pd.DataFrame:
+    """Converts a PyArrow Table or RecordBatch into a Pandas DataFrame.
+
+    Each column becomes its own pandas block, and the Arrow buffers are
+    released as they are converted, so `data` must not be used afterwards.
+
+    Args:
+        data: The data read by `read_csv` or `open_csv`.
+
+    Returns:
+        The data as a Pandas DataFrame.
+    """
+    nullable_bools = [
+        field.name
+        for field, column in zip(data.schema, data.columns)
+        if pa.types.is_boolean(field.type) and column.null_count
+    ]
+    # Columns with no values are float64 in pandas, unless there are no rows
+    empty_columns = [
+        field.name
+        for field in data.schema
+        if pa.types.is_null(field.type) and data.num_rows
+    ]
+    frame = data.to_pandas(split_blocks=True, self_destruct=True)
+    for name in nullable_bools:
+        frame[name] = frame[name].fillna(np.nan)
+    for name in empty_columns:
+        frame[name] = frame[name].astype("float64")
+
+    return frame
+
+
+def _convert_options(
+    usecols: list[str] | None, dtype: dict[str, str] | None
+) -> pa_csv.ConvertOptions:
+    """Builds the conversion options with pandas' NA strings as nulls."""
+    return pa_csv.ConvertOptions(
+        include_columns=usecols or [],
+        column_types=dtype or {},
+        null_values=list(STR_NA_VALUES),
+        strings_can_be_null=True,
+    )
+
+
+def _use_pandas_types(
+    schema: pa.Schema, convert_options: pa_csv.ConvertOptions
+) -> bool:
+    """Sets string types for inferred temporal columns.
+
+    Columns whose type was given in `convert_options` are left as they are.
+
+    Returns:
+        Whether any column types were set, in which case the file must be
+        read again.
+    """
+    column_types = convert_options.column_types
+    pandas_types = {}
+    for field in schema:
+        if field.name in column_types:
+            continue
+        if pa.types.is_temporal(field.type):
+            pandas_types[field.name] = pa.string()
+
+    if not pandas_types:
+        return False
+
+    convert_options.column_types = {**column_types, **pandas_types}
+
+    return True
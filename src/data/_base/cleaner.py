@@ -34,6 +34,8 @@ class AbstractCleaner(ABC):
     Defines the core methods for data cleaning tasks.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def clean_data(self, data):
         """Clean the data.
@@ -53,6 +55,8 @@ class Cleaner(AbstractCleaner):
     Provides a default __init__() method for specific implementation.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialise an instance of Cleaner."""
         pass
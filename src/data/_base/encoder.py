@@ -75,6 +75,8 @@ from typing import Any
 class AbstractEncoder(ABC):
     """Base class for all encoder implementations."""
 
+    __slots__ = ()
+
     @abstractmethod
     def decode(self, data: Any) -> Any:
         """Decodes data from a universal format into a specific format."""
@@ -89,6 +91,8 @@ class AbstractEncoder(ABC):
 class Encoder(AbstractEncoder):
     """Concrete base class for encoders."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initializes the encoder."""
         pass
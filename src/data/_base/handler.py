@@ -0,0 +1,50 @@
+"""data/_base/handler.py
+
+Purpose
+-------
+This module defines the base classes for data handlers, which load data
+from and save data to disk in a specific storage format and backend. It
+provides an abstract base class, `AbstractDataHandler`, and a concrete
+base class, `DataHandler`.
+
+Classes
+-------
+`AbstractDataHandler` (ABC):
+- Represents the base class for all data handler implementations.
+- Provides abstract methods for loading and saving data.
+
+`DataHandler`:
+- A concrete implementation of the `AbstractDataHandler` class.
+- Provides a default implementation for the `__init__` method.
+- If a concrete class inherits from this class, only specific implementations
+are needed, although the `__init__` method can also be extended if desired.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class AbstractDataHandler(ABC):
+    """Base class for all data handler implementations."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def load_data(self, path: str) -> Any:
+        """Loads the data stored at the given path."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_data(self, data: Any, path: str) -> None:
+        """Saves the data to the given path."""
+        raise NotImplementedError
+
+
+class DataHandler(AbstractDataHandler):
+    """Concrete base class for data handlers."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        """Initializes the data handler."""
+        pass
@@ -11,13 +11,13 @@ Recommendation
 --------------
 All specific implementations should inherit from the concrete `Validator`.
 
-Extending the DataValidator
----------------------------
+Extending the Validator
+-----------------------
 
-- Inherit from `DataValidator`.
+- Inherit from `Validator`.
 - Implement the abstract methods.
-- Override `validate_data`, calling `super().__init__(data, schema)` first
-and then add any other validations needed.
+- Override `validate_data`, calling `super().validate_data(data, schema)`
+first and then add any other validations needed.
 
 Classes
 -------
@@ -25,7 +25,7 @@ Classes
 - Abstract base class for data validation.
 - Provides abstract methods for basic data validation.
 
-`DataValidator`:
+`Validator`:
 - Concrete implementation of the `AbstractValidator` class.
 - Default implementation for `__init__()` and `validate_data()`.
 - Specific implementations should implement the abstract methods.
@@ -34,16 +34,16 @@ Usage
 -----
 Developers can use the provided validator classes to perform basic data
 validation against a specified schema. To create custom validators, inherit
-from `DataValidator` and implement the required methods.
+from `Validator` and implement the required methods.
 
 Example
 -------
 ```python
 # Example Usage of CustomValidator
-from data._base.validator import DataValidator
+from data._base.validator import Validator
 
-class CustomValidator(DataValidator):
-    def get_shape(self) -> tuple[int, int]:
+class CustomValidator(Validator):
+    def get_shape(self, data) -> tuple[int, int]:
         # Implement custom logic to get data shape
         pass
 
@@ -53,18 +53,21 @@ class CustomValidator(DataValidator):
 
     # Implement other abstract methods
 
-    def validate_data(self, data, schema: dict):
-        super().__init__(data, schema)
+    def validate_data(self, data, schema: dict | None = None):
+        super().validate_data(data, schema)
         # Add additional custom validations
 ```
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
 
 class AbstractValidator(ABC):
     """Abstract base class for data validation."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_shape(self) -> tuple[int, int]:
         """Get the data's shape (number of rows, number of columns)."""
@@ -76,7 +79,7 @@ class AbstractValidator(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def get_feature_names(self, data) -> dict[str, str]:
+    def get_feature_names(self, data) -> Collection[str]:
         """Get the names of the features in the data."""
         raise NotImplementedError()
 
@@ -102,45 +105,96 @@ class AbstractValidator(ABC):
 class Validator(AbstractValidator):
     """Implements data validation using the defined schema."""
 
-    def __init__(self):
-        pass
+    __slots__ = ("_compiled_schema",)
 
-    def validate_data(self, data, schema: dict):
+    def __init__(self, schema: dict | None = None):
+        """Initialise an instance of Validator.
+
+        Args:
+            schema: The schema to validate against when `validate_data` is
+            called without one. It is normalised once here, so repeated
+            validations (e.g. per chunk) do not redo that work. Default is
+            `None`.
+        """
+        self._compiled_schema = (
+            None if schema is None else self._compile_schema(schema)
+        )
+
+    @staticmethod
+    def _compile_schema(schema: dict) -> tuple:
+        """Normalise a schema into the forms compared in `validate_data`.
+
+        Returns:
+            The expected shape, number of missing values, feature names and
+            sorted (feature, dtype) pairs.
+        """
+        expected_feature_dtypes = schema["features"]
+
+        return (
+            tuple(schema["shape"]),
+            schema["num_missing"],
+            frozenset(expected_feature_dtypes),
+            tuple(sorted(expected_feature_dtypes.items())),
+        )
+
+    def validate_data(self, data, schema: dict | None = None):
         """Validate the data against the specified schema.
 
         Args:
             data: The data to be validated.
             schema: The schema against which the data should be validated.
+            If `None`, the schema given at initialisation is used.
 
         Raises:
             ValueError: If the data does not conform to the schema.
+            TypeError: If no schema was given here or at initialisation.
         """
+        if schema is not None:
+            compiled_schema = self._compile_schema(schema)
+        elif self._compiled_schema is not None:
+            compiled_schema = self._compiled_schema
+        else:
+            raise TypeError("No schema was given to validate the data against.")
+
+        (
+            expected_shape,
+            expected_num_missing,
+            expected_feature_names,
+            expected_feature_dtypes_items,
+        ) = compiled_schema
+
         observed_shape = self.get_shape(data)
-        expected_shape = tuple(schema["shape"])
-        assert observed_shape == expected_shape, (
-            f"Observed shape {observed_shape}"
-            + f"does not match expected shape {expected_shape}."
-        )
+        if observed_shape != expected_shape:
+            raise ValueError(
+                f"Observed shape {observed_shape} "
+                + f"does not match expected shape {expected_shape}."
+            )
 
         observed_num_missing = self.get_number_of_missing_values(data)
-        expected_num_missing = schema["num_missing"]
-        assert observed_num_missing == expected_num_missing, (
-            f"Observed number of missing values {observed_num_missing}"
-            + f"does not match expected {expected_num_missing}."
-        )
+        if observed_num_missing != expected_num_missing:
+            raise ValueError(
+                f"Observed number of missing values {observed_num_missing} "
+                + f"does not match expected {expected_num_missing}."
+            )
 
         observed_feature_dtypes = self.get_feature_dtypes(data)
 
-        observed_feature_names = set(observed_feature_dtypes.keys())
-        expected_feature_names = set(schema["features"].keys())
-        assert observed_feature_names == expected_feature_names, (
-            f"Observed feature names {observed_feature_names} do not match"
-            + f"expected feature names {expected_feature_names}."
-        )
-
-        expected_feature_dtypes = schema["features"]
-        for feature, dtype in observed_feature_dtypes.items():
-            assert dtype == expected_feature_dtypes[feature], (
-                f"Observed data type for feature {feature} is {dtype},"
-                + f"but expected {expected_feature_dtypes[feature]}."
+        # Compare the keys view directly rather than copying it into a set
+        observed_feature_names = observed_feature_dtypes.keys()
+        if observed_feature_names != expected_feature_names:
+            raise ValueError(
+                f"Observed feature names {set(observed_feature_names)} do not "
+                + f"match expected feature names {set(expected_feature_names)}."
             )
+
+        # A single tuple comparison on the happy path; only walk the features
+        # to find the offending one if it fails
+        observed_feature_dtypes_items = tuple(sorted(observed_feature_dtypes.items()))
+        if observed_feature_dtypes_items != expected_feature_dtypes_items:
+            expected_feature_dtypes = dict(expected_feature_dtypes_items)
+            for feature, dtype in observed_feature_dtypes.items():
+                if dtype != expected_feature_dtypes[feature]:
+                    raise ValueError(
+                        f"Observed data type for feature {feature} is {dtype}, "
+                        + f"but expected {expected_feature_dtypes[feature]}."
+                    )
@@ -9,8 +9,17 @@ Classes
 -------
 
 - `PandasCleaner`: Concrete cleaner class for Pandas DataFrames.
+
+Functions
+---------
+
+- `create_cleaner`: Create a data cleaner for a backend.
+- `register_cleaner`: Register a data cleaner class for a backend.
 """
 
+import functools
+from collections.abc import Iterable
+
 import pandas as pd
 
 from ._base import cleaner
@@ -23,28 +32,57 @@ class PandasDataCleaner(cleaner.Cleaner):
     and column renaming specific to Pandas DataFrames.
     """
 
+    __slots__ = ()
+
+    # Built once on the class rather than on every call to `clean_data`,
+    # which matters when cleaning chunk by chunk
+    dropped_columns = ["exam_score"]
+    renamed_columns = {
+        "mod_result": "did_pass",
+        "continous_ass_score": "cma_score",
+        "age": "estimated_age",
+    }
+
     def __init__(self):
         """Initalise a `PandasDataCleaner` instance."""
         super().__init__()
 
-    def clean_data(self, data: pd.DataFrame) -> pd.DataFrame:
+    def clean_data(
+        self, data: pd.DataFrame | Iterable[pd.DataFrame]
+    ) -> pd.DataFrame:
         """Clean and rename specific columns in the provided Pandas DataFrame.
 
+        The data may also be given as an iterable of DataFrame chunks (e.g.
+        from `CSVEncoder.iter_frames`), in which case each chunk is cleaned
+        as it arrives and only the cleaned chunks are concatenated, with a
+        fresh index.
+
         Args:
-            data: The Pandas DataFrame to be cleaned.
+            data: The Pandas DataFrame, or chunks of it, to be cleaned.
 
         Returns:
             The cleaned Pandas DataFrame.
         """
-        return data.drop(columns="exam_score").rename(
-            columns={
-                "mod_result": "did_pass",
-                "continous_ass_score": "cma_score",
-                "age": "estimated_age",
-            }
-        )
+        if isinstance(data, pd.DataFrame):
+            return self._clean_frame(data)
+
+        return pd.concat(map(self._clean_frame, data), ignore_index=True)
+
+    def _clean_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Clean and rename specific columns in a single Pandas DataFrame."""
+        # `drop` already returns a new frame, so rename it in place rather
+        # than allocating a second copy
+        cleaned_data = data.drop(columns=self.dropped_columns)
+        cleaned_data.rename(columns=self.renamed_columns, inplace=True)
+
+        return cleaned_data
 
 
+# Backend -> cleaner class
+_CLEANERS: dict[str, type[cleaner.Cleaner]] = {"pandas": PandasDataCleaner}
+
+
+@functools.lru_cache(maxsize=None)
 def create_cleaner(backend: str) -> cleaner.Cleaner:
     """Create a data cleaner based on the specified backend.
 
@@ -57,8 +95,19 @@ def create_cleaner(backend: str) -> cleaner.Cleaner:
     Raises:
         `NotImplementedError` if the specified backend is not supported.
     """
-    match backend:
-        case "pandas":
-            return PandasDataCleaner()
-        case _:
-            raise NotImplementedError(f"Backend {backend} is not supported.")
+    cleaner_class = _CLEANERS.get(backend)
+    if cleaner_class is None:
+        raise NotImplementedError(f"Backend {backend} is not supported.")
+
+    return cleaner_class()
+
+
+def register_cleaner(backend: str, cleaner_class: type[cleaner.Cleaner]) -> None:
+    """Register a data cleaner class for the specified backend.
+
+    Args:
+        backend: The data backend (e.g., "pandas").
+        cleaner_class: The cleaner class to create for the backend.
+    """
+    _CLEANERS[backend] = cleaner_class
+    create_cleaner.cache_clear()
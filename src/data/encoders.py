@@ -2,20 +2,24 @@
 
 This module provides concrete data encoders for specific data formats,
 facilitating the conversion of data between different formats.
-Two concrete encoder classes are implemented: `CSVEncoder` for handling
-CSV files and `PandasEncoder` for handling Pandas DataFrames.
+Three concrete encoder classes are implemented: `CSVEncoder` and
+`PyArrowCSVEncoder` for handling CSV files and `PandasEncoder` for handling
+Pandas DataFrames.
 
 Classes
 -------
 
 - `CSVEncoder`: Concrete encoder class for handling CSV files.
+- `PyArrowCSVEncoder`: CSV encoder using PyArrow's multithreaded parser.
 - `PandasEncoder`: Concrete encoder class for handling Pandas DataFrames.
 
-Factory Function
-----------------
+Factory Functions
+-----------------
 
-- `create_encoder(fmt: str) -> encoder.Encoder`: Creates an encoder instance
-for the specified data format.
+- `create_encoder(fmt: str, backend: str = "pandas") -> encoder.Encoder`:
+Creates an encoder instance for the specified data format.
+- `register_encoder(fmt: str, backend: str, encoder_class) -> None`:
+Registers an encoder class for the specified data format and backend.
 
 Example
 -------
@@ -27,18 +31,57 @@ from data.encoders import create_encoder
 # Create a CSVEncoder instance
 csv_encoder = create_encoder("csv")
 
+# Create a CSVEncoder instance backed by PyArrow
+arrow_csv_encoder = create_encoder("csv", backend="pyarrow")
+
 # Create a PandasEncoder instance
 pandas_encoder = create_encoder("pandas")
 """
 
+import functools
+from collections.abc import Iterator
+
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+
+    from . import _arrow_csv
+except ImportError:
+    pa = _arrow_csv = None
+
 from ._base import encoder
 
 
+def _to_records(data: pd.DataFrame) -> list[dict]:
+    """Converts a Pandas DataFrame into a list of dicts, one per row.
+
+    Equivalent to `data.to_dict(orient="records")`. When every column has a
+    non-object NumPy dtype (or is pandas' NaN-backed "str" dtype),
+    `itertuples` already yields native Python scalars, so the column names
+    are zipped onto each row directly and the per-value boxing that
+    `to_dict` repeats is skipped. Object columns (which may hold NumPy
+    scalars) and nullable extension dtypes (e.g. "Int64", "boolean") would
+    yield NumPy scalars and `pd.NA` that way, so they go through `to_dict`.
+    """
+    if not all(
+        (isinstance(dtype, np.dtype) and dtype.kind != "O")
+        or (isinstance(dtype, pd.StringDtype) and dtype.na_value is np.nan)
+        for dtype in data.dtypes
+    ):
+        return data.to_dict(orient="records")
+
+    columns = list(data.columns)
+
+    return [dict(zip(columns, row)) for row in data.itertuples(index=False, name=None)]
+
+
 class CSVEncoder(encoder.Encoder):
     """Concrete encoder class for handling CSV files."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialises the encoder."""
         super().__init__()
@@ -52,36 +95,231 @@ class CSVEncoder(encoder.Encoder):
         """
         pd.DataFrame(data).to_csv(path, index=False)
 
-    def encode(self, path: str) -> list[dict]:
+    def encode(
+        self,
+        path: str,
+        usecols: list[str] | None = None,
+        dtype: dict[str, str] | None = None,
+    ) -> list[dict]:
         """Converts data from a CSV file into a list of dicts.
 
         Args:
             path: The path to the CSV file to be encoded.
+            usecols: The columns to read. Unlisted columns are skipped by
+            the parser and never materialised. Default is `None` (all
+            columns).
+            dtype: Mapping of column -> dtype applied while parsing.
+            Default is `None` (inferred).
 
         Returns:
             The decoded data as a list of dicts.
         """
-        encoded_data = pd.read_csv(path).to_dict(orient="records")
+        encoded_data = _to_records(pd.read_csv(path, usecols=usecols, dtype=dtype))
 
         return encoded_data
 
+    def iter_encode(
+        self,
+        path: str,
+        chunksize: int,
+        usecols: list[str] | None = None,
+        dtype: dict[str, str] | None = None,
+    ) -> Iterator[list[dict]]:
+        """Converts data from a CSV file into lists of dicts, chunk by chunk.
+
+        Only one chunk is held in memory at a time, which bounds peak memory
+        on large files. The file is parsed as in `encode`, except that types
+        are inferred per chunk, so pass `dtype` for any column whose
+        inferred type could differ between chunks.
+
+        Args:
+            path: The path to the CSV file to be encoded.
+            chunksize: The number of rows per chunk.
+            usecols: The columns to read. Default is `None` (all columns).
+            dtype: Mapping of column -> dtype applied while parsing.
+            Default is `None` (inferred).
+
+        Yields:
+            Each chunk of the decoded data as a list of dicts.
+        """
+        for chunk in self.iter_frames(path, chunksize, usecols, dtype):
+            yield _to_records(chunk)
+
+    def iter_frames(
+        self,
+        path: str,
+        chunksize: int,
+        usecols: list[str] | None = None,
+        dtype: dict[str, str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Reads a CSV file into Pandas DataFrames, chunk by chunk.
+
+        Use this in place of `iter_encode` when the chunks are headed for a
+        Pandas backend (e.g. `PandasDataCleaner.clean_data`), as no per-row
+        dicts are built.
+
+        Args:
+            path: The path to the CSV file to be read.
+            chunksize: The number of rows per chunk.
+            usecols: The columns to read. Default is `None` (all columns).
+            dtype: Mapping of column -> dtype applied while parsing.
+            Default is `None` (inferred).
+
+        Yields:
+            Each chunk of the data as a Pandas DataFrame.
+        """
+        with pd.read_csv(
+            path, chunksize=chunksize, usecols=usecols, dtype=dtype
+        ) as reader:
+            yield from reader
+
+
+class PyArrowCSVEncoder(CSVEncoder):
+    """CSV encoder using PyArrow's multithreaded CSV parser.
+
+    The records match those of `CSVEncoder` for the same file: the same
+    tokens are read as missing, and date- and time-like text stays as
+    strings. Requires the optional `pyarrow` dependency.
+    """
+
+    __slots__ = ()
+
+    def encode(
+        self,
+        path: str,
+        usecols: list[str] | None = None,
+        dtype: dict[str, str] | None = None,
+    ) -> list[dict]:
+        """Converts data from a CSV file into a list of dicts.
+
+        Args:
+            path: The path to the CSV file to be encoded.
+            usecols: The columns to read. Default is `None` (all columns).
+            dtype: Mapping of column -> Arrow type name (e.g. "int64")
+            applied while parsing. Default is `None` (inferred).
+
+        Returns:
+            The decoded data as a list of dicts.
+        """
+        table = self.read_table(path, usecols, dtype)
+
+        return _to_records(_arrow_csv.to_pandas(table))
+
+    def iter_frames(
+        self,
+        path: str,
+        chunksize: int,
+        usecols: list[str] | None = None,
+        dtype: dict[str, str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Reads a CSV file into Pandas DataFrames, chunk by chunk.
+
+        See `iter_batches` for how the file is streamed. `iter_encode`
+        converts these chunks to lists of dicts.
+
+        Args:
+            path: The path to the CSV file to be read.
+            chunksize: The maximum number of rows per chunk.
+            usecols: The columns to read. Default is `None` (all columns).
+            dtype: Mapping of column -> Arrow type name (e.g. "int64")
+            applied while parsing. Default is `None` (inferred).
+
+        Yields:
+            Each chunk of the data as a Pandas DataFrame.
+        """
+        for batch in self.iter_batches(path, chunksize, usecols, dtype):
+            yield _arrow_csv.to_pandas(batch)
+
+    def iter_batches(
+        self,
+        path: str,
+        chunksize: int,
+        usecols: list[str] | None = None,
+        dtype: dict[str, str] | None = None,
+    ) -> Iterator["pa.RecordBatch"]:
+        """Reads a CSV file into PyArrow RecordBatches, chunk by chunk.
+
+        The file is streamed with PyArrow's incremental CSV reader, so only
+        one block of it is held in memory at a time. Blocks are split so that
+        no chunk exceeds `chunksize` rows; chunks may be shorter at block
+        boundaries. Arrow infers types from the first block only, so pass
+        `dtype` for any column whose type could change later in the file.
+        A file with no rows gives a single empty batch.
+        `PandasEncoder.decode` accepts the batches directly.
+
+        Args:
+            path: The path to the CSV file to be read.
+            chunksize: The maximum number of rows per chunk.
+            usecols: The columns to read. Default is `None` (all columns).
+            dtype: Mapping of column -> Arrow type name (e.g. "int64")
+            applied while parsing. Default is `None` (inferred).
+
+        Yields:
+            Each chunk of the data as a PyArrow RecordBatch.
+        """
+        with _arrow_csv.open_csv(path, usecols, dtype) as reader:
+            num_rows = 0
+            for batch in reader:
+                for offset in range(0, batch.num_rows, chunksize):
+                    yield batch.slice(offset, chunksize)
+                num_rows += batch.num_rows
+
+            # As with `pd.read_csv`, a file with no rows still gives one
+            # (empty) chunk carrying its columns
+            if not num_rows:
+                yield pa.RecordBatch.from_pylist([], schema=reader.schema)
+
+    def read_table(
+        self,
+        path: str,
+        usecols: list[str] | None = None,
+        dtype: dict[str, str] | None = None,
+    ) -> "pa.Table":
+        """Reads a CSV file into a columnar PyArrow Table.
+
+        Use this in place of `encode` when the data is headed for a
+        columnar backend, as `PandasEncoder.decode` accepts the Table
+        directly and no per-row dicts are built.
+
+        Args:
+            path: The path to the CSV file to be read.
+            usecols: The columns to read. Default is `None` (all columns).
+            dtype: Mapping of column -> Arrow type name (e.g. "int64")
+            applied while parsing. Default is `None` (inferred).
+
+        Returns:
+            The data as a PyArrow Table.
+        """
+        return _arrow_csv.read_csv(path, usecols, dtype)
+
 
 class PandasEncoder(encoder.Encoder):
     """Concrete encoder class for handling Pandas DataFrames."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialises the encoder."""
         super().__init__()
 
-    def decode(self, data: list[dict]) -> pd.DataFrame:
+    def decode(
+        self, data: "list[dict] | pa.Table | pa.RecordBatch"
+    ) -> pd.DataFrame:
         """Converts the given list of dicts into a Pandas DataFrame.
 
+        A PyArrow Table or RecordBatch (see `PyArrowCSVEncoder.read_table`
+        and `PyArrowCSVEncoder.iter_batches`) is also accepted and converted
+        column by column.
+
         Args:
             data: The data to be decoded.
 
         Returns:
             The decoded data in a Pandas DataFrame.
         """
+        if hasattr(data, "to_pandas"):
+            return data.to_pandas(split_blocks=True)
+
         return pd.DataFrame(data)
 
     def encode(self, data: pd.DataFrame) -> list[dict]:
@@ -93,14 +331,27 @@ class PandasEncoder(encoder.Encoder):
         Returns:
             The data as a list of dicts.
         """
-        return data.to_dict(orient="records")
+        return _to_records(data)
+
+
+# (format, backend) -> encoder class. PyArrow is optional, so its CSV
+# encoder falls back to the pandas one when it is not installed.
+_ENCODERS: dict[tuple[str, str], type[encoder.Encoder]] = {
+    ("csv", "pandas"): CSVEncoder,
+    ("csv", "pyarrow"): CSVEncoder if _arrow_csv is None else PyArrowCSVEncoder,
+    ("pandas", "pandas"): PandasEncoder,
+    ("pandas", "pyarrow"): PandasEncoder,
+}
 
 
-def create_encoder(fmt: str) -> encoder.Encoder:
+def create_encoder(fmt: str, backend: str = "pandas") -> encoder.Encoder:
     """Creates an encoder instance for the specified data format.
 
     Args:
         fmt (str): The data format for which to create an encoder.
+        backend (str): The library used to parse the data, "pandas" or
+        "pyarrow". Falls back to "pandas" if PyArrow is not installed.
+        Default is "pandas".
 
     Returns:
         encoder.Encoder: An encoder instance for the specified data format.
@@ -109,10 +360,32 @@ def create_encoder(fmt: str) -> encoder.Encoder:
         NotImplementedError: If encoding for the specified data format is
         not supported.
     """
-    match fmt:
-        case "csv":
-            return CSVEncoder()
-        case "pandas":
-            return PandasEncoder()
-        case _:
-            raise NotImplementedError(f"Encoding of {fmt} is not supported.")
+    return _create_encoder(fmt, backend)
+
+
+# Cached apart from `create_encoder`, which always passes both arguments by
+# position, so that every spelling of a call shares one instance
+@functools.lru_cache(maxsize=None)
+def _create_encoder(fmt: str, backend: str) -> encoder.Encoder:
+    """Creates the encoder for `create_encoder`."""
+    encoder_class = _ENCODERS.get((fmt, backend))
+    if encoder_class is None:
+        raise NotImplementedError(
+            f"Encoding of {fmt} with backend {backend} is not supported."
+        )
+
+    return encoder_class()
+
+
+def register_encoder(
+    fmt: str, backend: str, encoder_class: type[encoder.Encoder]
+) -> None:
+    """Registers an encoder class for the specified data format and backend.
+
+    Args:
+        fmt (str): The data format handled by the encoder.
+        backend (str): The library the encoder uses.
+        encoder_class (type[encoder.Encoder]): The encoder class to create.
+    """
+    _ENCODERS[fmt, backend] = encoder_class
+    _create_encoder.cache_clear()
@@ -0,0 +1,151 @@
+"""data/handlers.py
+
+Purpose
+-------
+This module provides concrete data handlers for loading and saving data
+in specific storage formats with specific backends.
+
+CSV is kept for ingesting the raw data. Intermediate data passed between
+pipeline stages should be stored as Parquet, which is columnar and typed,
+so reloading it needs no text parsing or type inference.
+
+Classes
+-------
+- `CSVPandasDataHandler`: Loads and saves CSV files as Pandas DataFrames.
+Parsing uses PyArrow when it is installed.
+- `ParquetArrowDataHandler`: Loads and saves Parquet files as Pandas
+DataFrames through PyArrow. Requires the optional `pyarrow` dependency.
+
+Functions
+---------
+- `create_data_handler`: Create a data handler for a format and backend.
+- `register_data_handler`: Register a data handler class for a format and
+backend.
+"""
+
+import functools
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pyarrow import parquet as pq
+
+    from . import _arrow_csv
+except ImportError:
+    pa = pq = _arrow_csv = None
+
+from ._base import handler
+
+
+class CSVPandasDataHandler(handler.DataHandler):
+    """Data handler for CSV files loaded as Pandas DataFrames."""
+
+    __slots__ = ()
+
+    def load_data(self, path: str) -> pd.DataFrame:
+        """Loads a CSV file into a Pandas DataFrame.
+
+        The file is parsed with PyArrow's multithreaded CSV reader when it
+        is installed, and with `pd.read_csv` otherwise. Either way the
+        same tokens (e.g. "", "NA", "None") are read as missing, and
+        date- and time-like text stays as strings.
+
+        Args:
+            path: The path to the CSV file.
+
+        Returns:
+            The data as a Pandas DataFrame.
+        """
+        if _arrow_csv is None:
+            return pd.read_csv(path)
+
+        return _arrow_csv.to_pandas(_arrow_csv.read_csv(path))
+
+    def save_data(self, data: pd.DataFrame, path: str) -> None:
+        """Saves a Pandas DataFrame to a CSV file.
+
+        Args:
+            data: The data to be saved.
+            path: The path to the output CSV file.
+        """
+        data.to_csv(path, index=False)
+
+
+class ParquetArrowDataHandler(handler.DataHandler):
+    """Data handler for Parquet files, read and written through PyArrow."""
+
+    __slots__ = ()
+
+    def load_data(self, path: str) -> pd.DataFrame:
+        """Loads a Parquet file into a Pandas DataFrame.
+
+        The file is memory-mapped, and each column becomes its own pandas
+        block, so numeric columns can be taken over without a copy. Arrow
+        buffers are released as they are converted, which keeps peak memory
+        close to the size of one copy of the data.
+
+        Args:
+            path: The path to the Parquet file.
+
+        Returns:
+            The data as a Pandas DataFrame.
+        """
+        table = pq.read_table(path, memory_map=True)
+
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def save_data(self, data: pd.DataFrame, path: str) -> None:
+        """Saves a Pandas DataFrame to a zstd-compressed Parquet file.
+
+        Args:
+            data: The data to be saved.
+            path: The path to the output Parquet file.
+        """
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        pq.write_table(table, path, compression="zstd")
+
+
+# (format, backend) -> data handler class
+_DATA_HANDLERS: dict[tuple[str, str], type[handler.DataHandler]] = {
+    ("csv", "pandas"): CSVPandasDataHandler,
+}
+if pq is not None:
+    _DATA_HANDLERS["parquet", "pandas"] = ParquetArrowDataHandler
+
+
+@functools.lru_cache(maxsize=None)
+def create_data_handler(fmt: str, backend: str) -> handler.DataHandler:
+    """Create a data handler for the specified storage format and backend.
+
+    Args:
+        fmt: The storage format (e.g., "csv", "parquet").
+        backend: The in-memory data backend (e.g., "pandas").
+
+    Returns:
+        A data handler instance for the format and backend.
+
+    Raises:
+        `NotImplementedError` if the format and backend are not supported.
+    """
+    data_handler_class = _DATA_HANDLERS.get((fmt, backend))
+    if data_handler_class is None:
+        raise NotImplementedError(
+            f"Handling {fmt} data with backend {backend} is not supported."
+        )
+
+    return data_handler_class()
+
+
+def register_data_handler(
+    fmt: str, backend: str, data_handler_class: type[handler.DataHandler]
+) -> None:
+    """Register a data handler class for the specified format and backend.
+
+    Args:
+        fmt: The storage format (e.g., "csv", "parquet").
+        backend: The in-memory data backend (e.g., "pandas").
+        data_handler_class: The data handler class to create.
+    """
+    _DATA_HANDLERS[fmt, backend] = data_handler_class
+    create_data_handler.cache_clear()
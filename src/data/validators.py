@@ -8,18 +8,51 @@ Classes
 -------
 - `PandasDataValidator`: Concrete validator class for handling Pandas
 DataFrames.
+- `ArrowDataValidator`: Concrete validator class for handling PyArrow
+Tables. Requires the optional `pyarrow` dependency.
+
+Functions
+---------
+- `create_validator`: Create a data validator for a backend.
+- `register_validator`: Register a data validator class for a backend.
 """
 
+import functools
+
 import pandas as pd
 
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 from ._base import validator
 
+# Pandas dtype name -> generic data type used in schemas. "str" is the
+# default string dtype from pandas 3.
+_GENERIC_DTYPES = {
+    "int32": "integer",
+    "int64": "integer",
+    "object": "string",
+    "category": "string",
+    "str": "string",
+    "float64": "real",
+}
+
+# Arrow type name -> generic data type used in schemas
+_GENERIC_ARROW_DTYPES = {
+    "int32": "integer",
+    "int64": "integer",
+    "string": "string",
+    "large_string": "string",
+    "double": "real",
+}
+
 
 class PandasDataValidator(validator.Validator):
     """Data validation class for Pandas DataFrames."""
 
-    def __init__(self):
-        super().__init__()
+    __slots__ = ()
 
     def get_shape(self, data: pd.DataFrame) -> tuple[int, int]:
         """Get the data's shape (number of rows, number of columns).
@@ -41,18 +74,20 @@ class PandasDataValidator(validator.Validator):
         Returns:
             Number of missing values
         """
-        return data.isna().sum().sum()
+        # Reduce the boolean mask in one pass rather than summing per column
+        # and then again over the resulting Series
+        return int(data.isna().to_numpy().sum())
 
-    def get_feature_names(self, data: pd.DataFrame) -> set[str]:
+    def get_feature_names(self, data: pd.DataFrame) -> pd.Index:
         """Get the names of the features in the data.
 
         Args:
             data: A Pandas DataFrame
 
         Returns:
-            Set of feature names
+            Index of feature names (the DataFrame's own columns, not a copy)
         """
-        return set(data.columns.values)
+        return data.columns
 
     def get_feature_dtypes(self, data: pd.DataFrame) -> dict[str, str]:
         """Get the datatypes of the features in the data.
@@ -63,29 +98,110 @@ class PandasDataValidator(validator.Validator):
         Returns:
             Dictionary mapping feature -> generic data type
         """
-        observed_feature_dtypes = data.dtypes.astype(str).to_dict()
+        mapped_feature_dtypes = {
+            feature: _GENERIC_DTYPES.get(str(dtype))
+            for feature, dtype in data.dtypes.items()
+        }
+        if None in mapped_feature_dtypes.values():
+            for feature, dtype in data.dtypes.items():
+                if mapped_feature_dtypes[feature] is None:
+                    raise ValueError(
+                        f"Unsupported dtype {dtype} for feature {feature}."
+                    )
+
+        return mapped_feature_dtypes
+
+
+class ArrowDataValidator(validator.Validator):
+    """Data validation class for PyArrow Tables."""
+
+    __slots__ = ()
+
+    def get_shape(self, data: "pa.Table") -> tuple[int, int]:
+        """Get the data's shape (number of rows, number of columns).
+
+        Args:
+            data: A PyArrow Table
+
+        Returns:
+            Shape of the data (n_rows, n_cols)
+        """
+        return data.shape
+
+    def get_number_of_missing_values(self, data: "pa.Table") -> int:
+        """Get the total number of missing values in the data.
+
+        Each Arrow column tracks its own null count, so this reads one
+        count per column rather than scanning every value.
+
+        Args:
+            data: A PyArrow Table
+
+        Returns:
+            Number of missing values
+        """
+        return sum(column.null_count for column in data.itercolumns())
+
+    def get_feature_names(self, data: "pa.Table") -> set[str]:
+        """Get the names of the features in the data.
+
+        Args:
+            data: A PyArrow Table
+
+        Returns:
+            Set of feature names
+        """
+        return set(data.column_names)
+
+    def get_feature_dtypes(self, data: "pa.Table") -> dict[str, str]:
+        """Get the datatypes of the features in the data.
+
+        Args:
+            data: A PyArrow Table
+
+        Returns:
+            Dictionary mapping feature -> generic data type
+        """
         mapped_feature_dtypes = {}
-        for feature, dtype in observed_feature_dtypes.items():
-            if dtype in set(["int32", "int64"]):
-                mapped_feature_dtypes[feature] = "integer"
-            elif dtype in set(["object", "category"]):
-                mapped_feature_dtypes[feature] = "string"
-            elif dtype in set(["float64"]):
-                mapped_feature_dtypes[feature] = "real"
-            else:
-                raise ValueError(f"Unsupported dtype {dtype} for feature {feature}.")
+        for field in data.schema:
+            dtype = field.type
+            # Dictionary-encoded columns are Arrow's categoricals
+            if pa.types.is_dictionary(dtype):
+                dtype = dtype.value_type
+
+            mapped_dtype = _GENERIC_ARROW_DTYPES.get(str(dtype))
+            if mapped_dtype is None:
+                raise ValueError(
+                    f"Unsupported dtype {field.type} for feature {field.name}."
+                )
+            mapped_feature_dtypes[field.name] = mapped_dtype
 
         return mapped_feature_dtypes
 
 
+# Backend -> validator class
+_VALIDATORS: dict[str, type[validator.Validator]] = {"pandas": PandasDataValidator}
+if pa is not None:
+    _VALIDATORS["arrow"] = ArrowDataValidator
+
+
+@functools.lru_cache(maxsize=None)
 def create_validator(backend: str) -> validator.Validator:
     """Factory function for creating data validators based on the specified
     backend.
+
+    The validator is created without a schema.
     """
-    match backend:
-        case "pandas":
-            return PandasDataValidator()
-        case _:
-            raise NotImplementedError(
-                f"No validator for {backend} has been implemented"
-            )
+    validator_class = _VALIDATORS.get(backend)
+    if validator_class is None:
+        raise NotImplementedError(f"No validator for {backend} has been implemented")
+
+    return validator_class()
+
+
+def register_validator(
+    backend: str, validator_class: type[validator.Validator]
+) -> None:
+    """Register a data validator class for the specified backend."""
+    _VALIDATORS[backend] = validator_class
+    create_validator.cache_clear()
@@ -5,11 +5,15 @@ from abc import ABC, abstractmethod
 
 
 class AbstractFeatureBuilder(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def build_features(self, data):
         raise NotImplementedError()
 
 
 class FeatureBuilder(AbstractFeatureBuilder):
+    __slots__ = ()
+
     def __init__(self):
         pass
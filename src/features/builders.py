@@ -1,25 +1,42 @@
 """features.build_features
 """
 
+import functools
+
 import pandas as pd
 
 from ._base import builder
 
 
 class PandasFeatureBuilder(builder.FeatureBuilder):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
     def build_features(self, data: pd.DataFrame) -> pd.DataFrame:
         return data.assign(
-            is_female=lambda x: x["gender"].map(lambda s: 1 if s == "female" else 0),
-            is_maths=lambda x: x["qual_link"].map(lambda s: 1 if s == "maths" else 0),
+            is_female=lambda x: x["gender"].eq("female").fillna(False).astype("int64"),
+            is_maths=lambda x: x["qual_link"].eq("maths").fillna(False).astype("int64"),
         ).drop(columns=["gender", "qual_link"])
 
 
+_FEATURE_BUILDERS: dict[str, type[builder.FeatureBuilder]] = {
+    "pandas": PandasFeatureBuilder
+}
+
+
+@functools.lru_cache(maxsize=None)
 def create_feature_builder(backend: str) -> builder.FeatureBuilder:
-    match backend:
-        case "pandas":
-            return PandasFeatureBuilder()
-        case _:
-            raise NotImplementedError(f"Backend {backend} is not supported.")
+    feature_builder_class = _FEATURE_BUILDERS.get(backend)
+    if feature_builder_class is None:
+        raise NotImplementedError(f"Backend {backend} is not supported.")
+
+    return feature_builder_class()
+
+
+def register_feature_builder(
+    backend: str, feature_builder_class: type[builder.FeatureBuilder]
+) -> None:
+    _FEATURE_BUILDERS[backend] = feature_builder_class
+    create_feature_builder.cache_clear()
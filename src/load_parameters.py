@@ -9,9 +9,45 @@ Functions:
 - `load_parameters(path: str, name: str | None = None) -> dict[str, Any]`
 """
 
-import tomllib
+import copy
+import functools
+import os
+from pathlib import Path
 from typing import Any
 
+try:
+    import rtoml
+except ImportError:
+    rtoml = None
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib
+
+
+def _parse_toml(path: str) -> dict[str, Any]:
+    """Parse a TOML file, preferring the compiled `rtoml` parser.
+
+    Falls back to `tomllib` (or `tomli` before Python 3.11) when `rtoml`
+    is not installed.
+    """
+    if rtoml is not None:
+        return rtoml.load(Path(path))
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_toml(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a TOML file, memoised on its path and modification time.
+
+    The modification time is part of the cache key so that edits to the
+    file are picked up without restarting the interpreter.
+    """
+    return _parse_toml(path)
+
 
 def load_parameters(path: str, name: str | None = None) -> dict[str, Any]:
     """
@@ -39,10 +75,13 @@ def load_parameters(path: str, name: str | None = None) -> dict[str, Any]:
         ```
     """
 
-    with open(path, "rb") as f:
-        parameters = tomllib.load(f)
+    # Resolve the path so that different spellings of the same file share
+    # a cache entry
+    path = os.path.realpath(path)
+    parameters = _load_toml(path, os.stat(path).st_mtime_ns)
 
     if name and name not in parameters:
         raise ValueError(f"Arg {name} is not a key in the TOML file.")
 
-    return parameters if name is None else parameters.get(name)
+    # Return a copy so callers cannot mutate the cached parse
+    return copy.deepcopy(parameters if name is None else parameters.get(name))
@@ -3,6 +3,7 @@
 
 from abc import ABC
 import dataclasses
+import functools
 
 import pandas as pd
 
@@ -17,8 +18,10 @@ class Dataset(AbstractDataset):
     X: pd.DataFrame
     y: pd.Series
 
-    def __post_init__(self):
-        self.Xy = pd.concat([self.X, self.y], axis="columns")
+    @functools.cached_property
+    def Xy(self) -> pd.DataFrame:
+        # Built on first access only, as it copies all of X and y
+        return pd.concat([self.X, self.y], axis="columns")
 
 
 @dataclasses.dataclass
@@ -1,6 +1,7 @@
 """model/split_data.py
 """
 
+import numpy as np
 import pandas as pd
 from sklearn import model_selection
 
@@ -13,13 +14,19 @@ def train_test_split(data: pd.DataFrame, modelling_params: dict) -> dataset.Data
     test_size = modelling_params["test_size"]
     random_state = modelling_params["random_state"]
 
-    # Collect data as X, y
-    X = data.drop(columns=response)
-    y = data[response]
-
-    X_train, X_test, y_train, y_test = model_selection.train_test_split(
-        X, y, test_size=test_size, random_state=random_state
+    # Split the row positions rather than X and y themselves, so each of
+    # X_train, X_test, y_train, y_test is gathered from `data` in a single
+    # pass instead of copying X out with `drop` and then gathering again
+    train_rows, test_rows = model_selection.train_test_split(
+        np.arange(len(data)), test_size=test_size, random_state=random_state
     )
+    response_col = data.columns.get_loc(response)
+    predictor_cols = [col for col in range(data.shape[1]) if col != response_col]
+
+    X_train = data.iloc[train_rows, predictor_cols]
+    X_test = data.iloc[test_rows, predictor_cols]
+    y_train = data.iloc[train_rows, response_col]
+    y_test = data.iloc[test_rows, response_col]
 
     # Initalise the training and testing datasets
     training_dataset = dataset.Dataset(X_train, y_train)